@@ -1,13 +1,50 @@
 # -*- coding: utf-8 -*-
+import atexit
 import os
 import re
 from tempfile import mkdtemp
 import subprocess
 import shutil
+from concurrent.futures import ProcessPoolExecutor
+
+# Async file writing is optional; without aiofiles the sentence files are
+# written sequentially as before.
+try:
+  import asyncio
+  import aiofiles
+except ImportError:
+  aiofiles = None
+
+from . import native
 
 #TODO(jimmycode): current implementation do not support multiple systems.
 #                 May add multi-system summary support in the future.
 
+# Matches one score line of the ROUGE report, e.g.
+# "1 ROUGE-SU4 Average_R: 0.23529 (95%-conf.int. ...)".
+_LINE_RE = re.compile(r"ROUGE-(\S+) Average_([RPF]): ([0-9.]+)")
+
+# Per-worker PythonROUGE used by evaluate_batch. Built once per process by
+# _init_worker so the command template and temp setup are not redone per chunk.
+_WORKER_ROUGE = None
+
+
+def _init_worker(config):
+  global _WORKER_ROUGE
+  _WORKER_ROUGE = PythonROUGE(**config)
+
+
+def _evaluate_chunk(args):
+  summaries, references, to_dict, recall_only, f_measure_only, temp_dir = args
+  result = _WORKER_ROUGE.evaluate(
+      summaries,
+      references,
+      to_dict=to_dict,
+      recall_only=recall_only,
+      f_measure_only=f_measure_only,
+      temp_dir=temp_dir)
+  return result, len(summaries)
+
 
 class PythonROUGE:
   MODEL_IDS = ["A", "B", "C", "D", "E", "F", "G"]
@@ -30,7 +67,10 @@ class PythonROUGE:
                resampling=True,
                samples=1000,
                favor=True,
-               p=0.5):
+               p=0.5,
+               native=False,
+               native_only=False,
+               use_server=False):
     """
     Parameters:
         ROUGE_dir: absolute directory of ROUGE-RELEASE-1.5.5 installation.
@@ -50,12 +90,36 @@ class PythonROUGE:
         samples: pecify the number of sampling point in bootstrap resampling (default is 1000).
         favor: If True, set relative importance of ROUGE scores as blow.
         p: Relative importance of recall and precision ROUGE scores. Alpha -> 1 favors precision, Alpha -> 0 favors recall.
+        native: Score with the pure-Python implementation in pythonrouge.native
+        instead of the Perl script. Much faster, but falls back to Perl
+        whenever the native scorer cannot honour the request: when use_cf
+        is set (confidence intervals need the Perl bootstrapping), when
+        ROUGE_W is set (ROUGE-W is not implemented natively), when
+        length_limit is set (the native scorer does not truncate), when
+        stemming is requested but nltk is not installed (the Perl always
+        stems), or when evaluate is called with to_dict=False (there is
+        no raw report).
+        native_only: Never touch the Perl script: evaluate goes straight
+        from sentence lists to scores with no file I/O at all. ROUGE-W and
+        confidence intervals are then simply not computed, length_limit is
+        not applied, and evaluate raises if called with to_dict=False or
+        when stemming is requested without nltk installed.
+        use_server: Keep one Perl process alive (see rouge_server.pl) and
+        feed it config paths over stdin, instead of paying interpreter
+        startup and WordNet loading on every run_rouge call.
     """
+    # Keep the constructor arguments so evaluate_batch can rebuild an
+    # identical PythonROUGE inside each worker process.
+    self._config = {k: v for k, v in locals().items() if k != "self"}
+
     if not ROUGE_dir:
       raise ValueError("ROUGE_dir must be specified.")
 
     self.ROUGE_path = os.path.join(ROUGE_dir, "ROUGE-1.5.5.pl")
     self.data_path = os.path.join(ROUGE_dir, "data")
+    # Resolve once: abspath stats nothing but does hit getcwd each call.
+    self._ROUGE_abspath = os.path.abspath(self.ROUGE_path)
+    self._data_abspath = os.path.abspath(self.data_path)
 
     self.n_gram = n_gram
     self.ROUGE_SU4 = ROUGE_SU4
@@ -74,19 +138,63 @@ class PythonROUGE:
     self.samples = samples
     self.favor = favor
     self.p = p
+    self.native = native
+    self.native_only = native_only
+    self.use_server = use_server
 
     self.rouge_cmd_tmp = self._get_rouge_cmd()  # command template
+    # The metric flags (and the formatted ROUGE-W-weight key) never change
+    # after construction, so the expected-key set is built once here
+    # rather than on every output_to_dict call.
+    self._expected = self._expected_keys()
+    self._workspace = None  # reusable temp tree, created on first use
+    self._server = None  # persistent Perl process, started on first use
+
+  _SERVER_SENTINEL = b"<<<ROUGE-DONE>>>\n"
+
+  def _get_server(self):
+    """ Start (or restart) the persistent Perl ROUGE process. """
+    if self._server is None or self._server.poll() is not None:
+      server_path = os.path.join(
+          os.path.dirname(os.path.abspath(__file__)), "rouge_server.pl")
+      # rouge_cmd_tmp is ['perl', ROUGE_path, options...]; the server takes
+      # the script path and options and appends one config path per line.
+      server_cmd = ["perl", server_path] + self.rouge_cmd_tmp[1:]
+      self._server = subprocess.Popen(
+          server_cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+      atexit.register(self._close_server)
+    return self._server
+
+  def _close_server(self):
+    if self._server is None:
+      return
+    try:
+      self._server.stdin.close()
+      self._server.wait(timeout=5)
+    except Exception:
+      self._server.kill()
+    self._server = None
+
+  def _get_workspace(self, temp_dir=None):
+    """
+    Long-lived temp tree reused across evaluate calls. Reusing one tree and
+    truncating files in place avoids creating and unlinking 2N+3 inodes on
+    every call; it is removed once at interpreter exit.
+    """
+    if self._workspace is None or not os.path.isdir(self._workspace):
+      # Also recreate when the cached tree was removed behind our back
+      # (e.g. an external cleanup of temp_dir between evaluate calls).
+      self._workspace = mkdtemp(prefix="pyrouge_", dir=temp_dir)
+      atexit.register(shutil.rmtree, self._workspace, ignore_errors=True)
+    return self._workspace
 
   def _get_rouge_cmd(self):
-    ROUGE_path = os.path.abspath(self.ROUGE_path)
-    data_path = os.path.abspath(self.data_path)
-
-    rouge_cmd = ['perl', ROUGE_path, "-e", data_path, "-a"]
+    rouge_cmd = ['perl', self._ROUGE_abspath, "-e", self._data_abspath, "-a"]
     assert self.n_gram > 0, "n-gram should be positive."
-    rouge_cmd += "-n {}".format(self.n_gram).split()
+    rouge_cmd += ["-n", str(self.n_gram)]
 
     if self.ROUGE_SU4:
-      rouge_cmd += "-2 4 -u".split()
+      rouge_cmd += ["-2", "4", "-u"]
     if not self.ROUGE_L:
       rouge_cmd.append("-x")
     if self.ROUGE_W:
@@ -95,30 +203,56 @@ class PythonROUGE:
     if self.length_limit:
       assert self.length > 0, "Length limit should be positive."
       if self.word_level:
-        rouge_cmd += "-l {}".format(self.length).split()
+        rouge_cmd += ["-l", str(self.length)]
       else:
-        rouge_cmd += "-b {}".format(self.length).split()
+        rouge_cmd += ["-b", str(self.length)]
     if self.stemming:
       rouge_cmd.append("-m")
     if self.stopwords:
       rouge_cmd.append("-s")
     if self.use_cf:
-      rouge_cmd += "-c {}".format(self.cf).split()
+      rouge_cmd += ["-c", str(self.cf)]
 
     if self.scoring_formula == "average":
-      rouge_cmd += "-f A".split()
+      rouge_cmd += ["-f", "A"]
     elif self.scoring_formula == "best":
-      rouge_cmd += "-f B".split()
+      rouge_cmd += ["-f", "B"]
     else:
       raise ValueError("Choose scoring formula between 'average' and 'best'.")
 
     if self.resampling:
-      rouge_cmd += "-r {}".format(self.samples).split()
+      rouge_cmd += ["-r", str(self.samples)]
     if self.favor:
-      rouge_cmd += "-p {}".format(self.p).split()
+      rouge_cmd += ["-p", str(self.p)]
 
     return rouge_cmd
 
+  @staticmethod
+  def _write_files(writes):
+    """
+    Write (path, sentences) pairs. With aiofiles installed and enough
+    files for it to pay off, the writes run concurrently under
+    asyncio.gather so the many small open/write/close latencies overlap
+    (worthwhile on network or spinning-disk filesystems); otherwise they
+    are written sequentially, streaming one line per sentence.
+    """
+    if aiofiles is None or len(writes) < 8:
+      for path, sents in writes:
+        with open(path, "w") as f:
+          # Stream one line per sentence; joining first would allocate the
+          # whole file contents as an intermediate string.
+          f.writelines(sent + "\n" for sent in sents)
+      return
+
+    async def write_one(path, sents):
+      async with aiofiles.open(path, "w") as f:
+        await f.write("\n".join(sents) + "\n")
+
+    async def write_all():
+      await asyncio.gather(*(write_one(path, sents) for path, sents in writes))
+
+    asyncio.run(write_all())
+
   def convert_and_config(self, summary=[], reference=[], output_dir="", temp_dir=None):
     """
     Convert summaries and references to ROUGE format and generate config file.
@@ -134,29 +268,33 @@ class PythonROUGE:
                                  [summaryA_ref2_sent1, summaryA_ref2_sent2]],
                                 [[summaryB_ref1_sent1, summaryB_ref1_sent2],
                                  [summaryB_ref2_sent1, summaryB_ref2_sent2]]]
-        output_dir: directory of outputs. Temp dir is created if not given.
+        output_dir: directory of outputs. If not given, a workspace shared
+        across calls of this instance is reused (pass an explicit dir to
+        get a fresh per-call tree, e.g. for debugging).
 
     """
     assert len(summary) == len(
         reference), "Size of summary and refernece is different."
     if not output_dir:
-      output_dir = mkdtemp(dir=temp_dir)
+      output_dir = self._get_workspace(temp_dir)
     elif not os.path.exists(output_dir):
       os.mkdir(output_dir)
 
-    # Save system and reference files in output_dir
-    summary_path = os.path.join(output_dir, "system")
-    reference_path = os.path.join(output_dir, "reference")
-    os.mkdir(summary_path)
-    os.mkdir(reference_path)
+    # Save system and reference files flat in output_dir, telling them
+    # apart by a sys_/ref_ filename prefix: no per-call subdirectories to
+    # create, and cleanup stats a single flat directory. Opening in "w"
+    # mode truncates files left over from a previous call on the
+    # workspace. The directory prefix is precomputed; os.path.join in the
+    # inner loops is measurable for large batches.
+    dir_prefix = output_dir + os.sep
 
+    writes = []
     sum_file_lists = []
     for i, sums in enumerate(summary):
       file_list = []
       for j, sents in enumerate(sums):
-        filename = "{}_{}.txt".format(i, j)
-        with open(os.path.join(summary_path, filename), "w") as f:
-          f.writelines("\n".join(sents) + "\n")
+        filename = f"sys_{i}_{j}.txt"
+        writes.append((dir_prefix + filename, sents))
         file_list.append(filename)
       sum_file_lists.append(file_list)
 
@@ -164,139 +302,116 @@ class PythonROUGE:
     for i, refs in enumerate(reference):
       file_list = []
       for j, sents in enumerate(refs):
-        filename = "{}_{}.txt".format(i, j)
-        with open(os.path.join(reference_path, filename), "w") as f:
-          f.writelines("\n".join(sents) + "\n")
+        filename = f"ref_{i}_{j}.txt"
+        writes.append((dir_prefix + filename, sents))
         file_list.append(filename)
       ref_file_lists.append(file_list)
 
+    self._write_files(writes)
+
     config_path = os.path.join(output_dir, "config.xml")
-    with open(config_path, "w") as xml_file:
-      config_str = '<ROUGE-EVAL version="1.0">\n'
+    # Write each tag straight through the (generously buffered) file
+    # object: Python-level memory stays constant no matter how many EVAL
+    # entries the batch has, and the buffer still coalesces the syscalls.
+    with open(config_path, "w", buffering=1 << 20) as xml_file:
+      w = xml_file.write  # local alias, skips the attribute lookup per tag
+      w('<ROUGE-EVAL version="1.0">\n')
 
       for i, (sum_fl, ref_fl) in enumerate(zip(sum_file_lists, ref_file_lists)):
-        config_str += '<EVAL ID="{}">\n'.format(i + 1)
-        config_str += "<PEER-ROOT>{}</PEER-ROOT>\n".format(summary_path)
-        config_str += "<MODEL-ROOT>{}</MODEL-ROOT>\n".format(reference_path)
-        config_str += '<INPUT-FORMAT TYPE="SPL">\n"</INPUT-FORMAT>\n'
+        w(f'<EVAL ID="{i + 1}">\n')
+        w(f"<PEER-ROOT>{output_dir}</PEER-ROOT>\n")
+        w(f"<MODEL-ROOT>{output_dir}</MODEL-ROOT>\n")
+        w('<INPUT-FORMAT TYPE="SPL">\n"</INPUT-FORMAT>\n')
 
-        config_str += "<PEERS>\n"
+        w("<PEERS>\n")
         for j, fn in enumerate(sum_fl):
-          config_str += '<P ID="{}">{}</P>\n'.format(j + 1, fn)  # start with 1
-        config_str += "</PEERS>\n"
+          w(f'<P ID="{j + 1}">{fn}</P>\n')  # start with 1
+        w("</PEERS>\n")
 
-        config_str += "<MODELS>\n"
+        w("<MODELS>\n")
         for j, fn in enumerate(ref_fl):
-          config_str += '<M ID="{}">{}</M>\n'.format(self.MODEL_IDS[j], fn)
-        config_str += "</MODELS>\n"
-        config_str += "</EVAL>\n"
+          w(f'<M ID="{self.MODEL_IDS[j]}">{fn}</M>\n')
+        w("</MODELS>\n")
+        w("</EVAL>\n")
 
-      config_str += "</ROUGE-EVAL>\n"
-      xml_file.write(config_str)
+      w("</ROUGE-EVAL>\n")
 
     return output_dir, config_path
 
   def run_rouge(self, config_path):
+    if self.use_server and not self.use_cf:
+      server = self._get_server()
+      server.stdin.write(config_path.encode("utf-8") + b"\n")
+      server.stdin.flush()
+      lines = []
+      for raw in iter(server.stdout.readline, b""):
+        if raw == self._SERVER_SENTINEL:
+          break
+        lines.append(raw)
+      else:
+        # EOF before the sentinel: the server process died mid-request.
+        # _close_server reaps it, so returncode is set afterwards.
+        self._close_server()
+        raise subprocess.CalledProcessError(
+            server.returncode if server.returncode is not None else -1,
+            server.args,
+            output=b"".join(lines))
+      output = b"".join(lines)
+      if b"ROUGE-SERVER-ERROR:" in output:
+        # The ROUGE script died (or called exit) inside the server; fail
+        # the same way the one-shot subprocess.run(check=True) path does.
+        raise subprocess.CalledProcessError(1, server.args, output=output)
+      return output
+
     rouge_cmd = self.rouge_cmd_tmp + [config_path]
-    output = subprocess.check_output(rouge_cmd, stderr=subprocess.STDOUT)
+    # Discard stderr instead of folding it into the captured output: the
+    # parser only reads score lines, and merging grows the stdout buffer
+    # (and its decode) with every warning ROUGE prints. LC_ALL=C keeps
+    # Perl off locale-dependent slow paths.
+    output = subprocess.run(
+        rouge_cmd,
+        check=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        env=dict(os.environ, LC_ALL="C")).stdout
     return output
 
+  def _expected_keys(self):
+    """ Result keys the configured metrics will produce, for the early
+    exit in output_to_dict; cached as self._expected in __init__. """
+    metrics = {f"ROUGE-{n}" for n in range(1, self.n_gram + 1)}
+    if self.ROUGE_SU4:
+      metrics.add("ROUGE-SU4")
+    if self.ROUGE_L:
+      metrics.add("ROUGE-L")
+    if self.ROUGE_W:
+      metrics.add(f"ROUGE-W-{self.ROUGE_W_Weight}")
+    return {f"{metric}-{stat}" for metric in metrics for stat in "RPF"}
+
   def output_to_dict(self, output, recall_only=False, f_measure_only=False):
     """ Convert ROUGE output to key-value pairs in a dictionary. """
     assert not (
         recall_only and f_measure_only
     ), "At least one of recall_only and f_measure_only must be False."
 
+    expected = self._expected
     output = output.decode("utf-8")
-    outputs = output.strip().split("\n")
     result = dict()
-    n = 1
-    for line in outputs:
-      if self.ROUGE_SU4:
-        su_r_match = re.findall('ROUGE-SU4 Average_R: ([0-9.]+)', line)
-        su_p_match = re.findall('ROUGE-SU4 Average_P: ([0-9.]+)', line)
-        su_f_match = re.findall('ROUGE-SU4 Average_F: ([0-9.]+)', line)
-        if su_r_match:
-          if recall_only:
-            result['ROUGE-SU4'] = float(su_r_match[0])
-          elif f_measure_only:
-            pass
-          else:
-            result['ROUGE-SU4-R'] = float(su_r_match[0])
-        if not recall_only:
-          if f_measure_only and su_f_match:
-            result['ROUGE-SU4'] = float(su_f_match[0])
-          else:
-            if su_p_match and not f_measure_only:
-              result['ROUGE-SU4-P'] = float(su_p_match[0])
-            elif su_f_match and not f_measure_only:
-              result['ROUGE-SU4-F'] = float(su_f_match[0])
-      if self.ROUGE_L:
-        l_r_match = re.findall('ROUGE-L Average_R: ([0-9.]+)', line)
-        l_p_match = re.findall('ROUGE-L Average_P: ([0-9.]+)', line)
-        l_f_match = re.findall('ROUGE-L Average_F: ([0-9.]+)', line)
-        if l_r_match:
-          if recall_only:
-            result['ROUGE-L'] = float(l_r_match[0])
-          elif f_measure_only:
-            pass
-          else:
-            result['ROUGE-L-R'] = float(l_r_match[0])
-        if not recall_only:
-          if f_measure_only and l_f_match:
-            result['ROUGE-L'] = float(l_f_match[0])
-          else:
-            if l_p_match and not f_measure_only:
-              result['ROUGE-L-P'] = float(l_p_match[0])
-            elif l_f_match and not f_measure_only:
-              result['ROUGE-L-F'] = float(l_f_match[0])
-      if self.ROUGE_W:
-        w_r_match = re.findall(
-            'ROUGE-W-{} Average_R: ([0-9.]+)'.format(self.ROUGE_W_Weight), line)
-        w_p_match = re.findall(
-            'ROUGE-W-{} Average_P: ([0-9.]+)'.format(self.ROUGE_W_Weight), line)
-        w_f_match = re.findall(
-            'ROUGE-W-{} Average_F: ([0-9.]+)'.format(self.ROUGE_W_Weight), line)
-        if w_r_match:
-          if recall_only:
-            result['ROUGE-W-{}'.format(self.ROUGE_W_Weight)] = float(
-                w_r_match[0])
-          elif f_measure_only:
-            pass
-          else:
-            result['ROUGE-W-{}-R'.format(self.ROUGE_W_Weight)] = float(
-                w_r_match[0])
-        if not recall_only:
-          if f_measure_only and w_f_match:
-            result['ROUGE-W-{}'.format(self.ROUGE_W_Weight)] = float(
-                w_f_match[0])
-          else:
-            if w_p_match and not f_measure_only:
-              result['ROUGE-W-{}-P'.format(self.ROUGE_W_Weight)] = float(
-                  w_p_match[0])
-            elif w_f_match and not f_measure_only:
-              result['ROUGE-W-{}-F'.format(self.ROUGE_W_Weight)] = float(
-                  w_f_match[0])
-      r_match = re.findall('ROUGE-{} Average_R: ([0-9.]+)'.format(n), line)
-      p_match = re.findall('ROUGE-{} Average_P: ([0-9.]+)'.format(n), line)
-      f_match = re.findall('ROUGE-{} Average_F: ([0-9.]+)'.format(n), line)
-      if r_match:
-        if recall_only:
-          result['ROUGE-{}'.format(n)] = float(r_match[0])
-        elif f_measure_only:
-          pass
-        else:
-          result['ROUGE-{}-R'.format(n)] = float(r_match[0])
-      if not recall_only:
-        if f_measure_only and f_match:
-          result['ROUGE-{}'.format(n)] = float(f_match[0])
-        else:
-          if p_match and not f_measure_only:
-            result['ROUGE-{}-P'.format(n)] = float(p_match[0])
-          elif f_match and not f_measure_only:
-            result['ROUGE-{}-F'.format(n)] = float(f_match[0])
-      if f_match: n += 1
-
+    for line in output.splitlines():
+      match = _LINE_RE.search(line)
+      if not match:
+        continue
+      metric, stat, value = match.group(1), match.group(2), match.group(3)
+      result[f"ROUGE-{metric}-{stat}"] = float(value)
+      # Everything after the last expected score line is free text; stop
+      # scanning it once all requested metrics have been collected.
+      if len(result) >= len(expected) and expected <= result.keys():
+        break
+
+    if recall_only:
+      return {k[:-2]: v for k, v in result.items() if k.endswith("-R")}
+    if f_measure_only:
+      return {k[:-2]: v for k, v in result.items() if k.endswith("-F")}
     return result
 
   def evaluate(self,
@@ -312,11 +427,110 @@ class PythonROUGE:
       reference: triple list.
       to_dict: True if results need to be converted to dictionary.
     """
+    use_native = self.native_only or (
+        self.native and to_dict and not self.use_cf and not self.ROUGE_W
+        and not self.length_limit
+        and not (self.stemming and native._STEMMER is None))
+    if use_native:
+      if not to_dict:
+        # Native scoring never produces the raw Perl report, so honouring
+        # to_dict=False here would silently change the return type.
+        raise ValueError("native_only always returns a dictionary; "
+                         "call evaluate with to_dict=True.")
+      return native.score_batch(
+          summary,
+          reference,
+          self,
+          recall_only=recall_only,
+          f_measure_only=f_measure_only)
+
     output_dir, config_path = self.convert_and_config(summary, reference, temp_dir=temp_dir)
     result = self.run_rouge(config_path)
-    shutil.rmtree(output_dir)
+    if output_dir != self._workspace:
+      shutil.rmtree(output_dir)
 
     if to_dict:
       result = self.output_to_dict(result, recall_only, f_measure_only)
 
     return result
+
+  def reference_set(self, refs):
+    """
+    Build a native.ReferenceSet for one example's references using this
+    instance's settings, for use with score.
+    """
+    stopwords = native.load_stopwords(self.data_path) if self.stopwords \
+        else None
+    return native.ReferenceSet(
+        refs,
+        n_gram=self.n_gram,
+        ROUGE_SU4=self.ROUGE_SU4,
+        stemming=self.stemming,
+        stopwords=stopwords)
+
+  def score(self, candidate, refset, recall_only=False, f_measure_only=False):
+    """
+    Score one candidate summary (a list of sentences) against a prebuilt
+    native.ReferenceSet (see reference_set). Only the candidate is
+    tokenized and counted; all reference-side state is reused across
+    calls, which is the fast path for scoring many candidates against the
+    same references.
+    """
+    return native.score_batch(
+        [[candidate]], [refset.bundles],
+        self,
+        recall_only=recall_only,
+        f_measure_only=f_measure_only)
+
+  def evaluate_batch(self,
+                     summaries,
+                     references,
+                     n_jobs=None,
+                     to_dict=True,
+                     recall_only=False,
+                     f_measure_only=False,
+                     temp_dir=None):
+    """
+    Evaluate a batch of (summary, reference) pairs across worker processes.
+
+    The pairs are sharded into n_jobs chunks; each worker builds its own
+    PythonROUGE (and its own temp tree) and scores one chunk, then the
+    per-chunk macro averages are merged weighted by chunk size.
+
+    Parameters:
+      summaries: triple list, as in evaluate.
+      references: triple list, as in evaluate.
+      n_jobs: number of worker processes (default: os.cpu_count()).
+      to_dict: if False, the raw ROUGE output of each chunk is returned as
+      a list instead of a merged dictionary.
+    """
+    assert len(summaries) == len(
+        references), "Size of summary and refernece is different."
+    if n_jobs is None:
+      n_jobs = os.cpu_count() or 1
+    n_jobs = max(1, min(n_jobs, len(summaries)))
+
+    if n_jobs == 1:
+      result = self.evaluate(summaries, references, to_dict, recall_only,
+                             f_measure_only, temp_dir)
+      return result if to_dict else [result]
+
+    chunk_size = (len(summaries) + n_jobs - 1) // n_jobs
+    tasks = [(summaries[i:i + chunk_size], references[i:i + chunk_size],
+              to_dict, recall_only, f_measure_only, temp_dir)
+             for i in range(0, len(summaries), chunk_size)]
+
+    with ProcessPoolExecutor(
+        max_workers=n_jobs, initializer=_init_worker,
+        initargs=(self._config,)) as pool:
+      partials = list(pool.map(_evaluate_chunk, tasks))
+
+    if not to_dict:
+      return [result for result, _ in partials]
+
+    total = sum(count for _, count in partials)
+    merged = dict()
+    for result, count in partials:
+      for key, value in result.items():
+        merged[key] = merged.get(key, 0.0) + value * count
+    return {key: round(value / total, 5) for key, value in merged.items()}
@@ -0,0 +1,474 @@
+# -*- coding: utf-8 -*-
+"""Pure-Python ROUGE scoring.
+
+Computes ROUGE-N, ROUGE-L and ROUGE-SU4 directly on token lists so that
+the common evaluation path does not have to shell out to the Perl
+ROUGE-1.5.5 script. The Perl path remains available as a verification
+fallback and for options the native scorer does not cover (confidence
+intervals, bootstrap resampling, ROUGE-W).
+
+Tokenization matches the clean-up ROUGE-1.5.5's readText performs on
+SPL input, which replaces punctuation with spaces (s/[^A-Za-z0-9\-]/ /g)
+before any token filtering, with one exception: readText keeps
+intra-token hyphens ("well-known" is a single token to the Perl; the
+free-standing hyphens it splits out are dropped later by createNGram's
+[a-z0-9$]-prefix filter), whereas the native tokenizer splits on them.
+The one scoring divergence is in SU4: the Perl skip-bigram loop never
+counts the final token's unigram, so native SU4 totals run one unigram
+higher per summary (counting is over the flattened summary, not per
+sentence).
+"""
+import os
+import re
+import sys
+from collections import Counter
+
+# Stemming needs nltk's Porter stemmer; it is optional and only used when
+# requested, so degrade gracefully when nltk is not installed.
+try:
+  from nltk.stem.porter import PorterStemmer
+  _STEMMER = PorterStemmer()
+except ImportError:
+  _STEMMER = None
+
+# pandas is optional too: its C string routines make batch tokenization
+# worthwhile for very large corpora, see tokenize_batch.
+try:
+  import pandas as _pd
+except ImportError:
+  _pd = None
+
+# Compiled n-gram counting (built from _rouge_count.pyx when Cython is
+# available at install time); rouge_n falls back to Counter without it.
+try:
+  from pythonrouge import _rouge_count
+except ImportError:
+  _rouge_count = None
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+_STEM_CACHE = {}
+_STOPWORD_CACHE = {}
+
+# Below this many sentences the pandas round trip costs more than it saves.
+VECTORIZE_THRESHOLD = 10000
+
+
+def _require_stemmer():
+  if _STEMMER is None:
+    raise ImportError(
+        "stemming requires nltk; install nltk or pass stemming=False")
+
+
+def _stem(token):
+  """ Porter-stem a token, memoized. Tokens of <= 3 chars are left alone,
+  matching the behaviour of ROUGE-1.5.5. """
+  if _STEMMER is None or len(token) <= 3:
+    return token
+  stemmed = _STEM_CACHE.get(token)
+  if stemmed is None:
+    stemmed = _STEM_CACHE[token] = _STEMMER.stem(token)
+  return stemmed
+
+
+def load_stopwords(data_path):
+  """ Stopword set from smart_common_words.txt in the ROUGE data dir (the
+  same list the Perl -s option uses), cached per path. """
+  stopwords = _STOPWORD_CACHE.get(data_path)
+  if stopwords is None:
+    with open(os.path.join(data_path, "smart_common_words.txt")) as f:
+      stopwords = frozenset(line.strip() for line in f if line.strip())
+    _STOPWORD_CACHE[data_path] = stopwords
+  return stopwords
+
+
+def tokenize(sent, stemming=False, stopwords=None):
+  """
+  Lowercase a sentence, replace non-alphanumeric characters with spaces
+  and split on whitespace, the clean-up ROUGE-1.5.5's readText performs
+  on SPL input (except for intra-token hyphens, which the Perl keeps;
+  see the module docstring). Optionally remove stopwords and apply
+  Porter stemming.
+  """
+  return _finalize(_NON_ALNUM.sub(" ", sent.lower()).split(), stemming,
+                   stopwords)
+
+
+def _finalize(tokens, stemming, stopwords):
+  if stopwords:
+    tokens = [tok for tok in tokens if tok not in stopwords]
+  if stemming:
+    # Raise rather than silently skip the stemming: scores must not depend
+    # on whether an optional dependency happens to be installed.
+    _require_stemmer()
+    tokens = [_stem(tok) for tok in tokens]
+  # Interned tokens compare by identity in Counter/dict lookups, which
+  # pays off when the same references are scored against many candidates.
+  return [sys.intern(tok) for tok in tokens]
+
+
+def tokenize_batch(docs, stemming=False, stopwords=None):
+  """
+  Tokenize many documents (each a list of sentences) at once, returning a
+  list of per-sentence token lists per document. For large batches the
+  lowercase/strip/split work runs through pandas' C string routines when
+  pandas is installed; otherwise (or for small batches) this is simply the
+  per-sentence tokenizer in a loop.
+  """
+  if _pd is None or sum(len(doc) for doc in docs) < VECTORIZE_THRESHOLD:
+    return [[tokenize(sent, stemming, stopwords) for sent in doc]
+            for doc in docs]
+
+  flat = [sent for doc in docs for sent in doc]
+  token_lists = (_pd.Series(flat).str.lower().str.replace(
+      _NON_ALNUM, " ", regex=True).str.split().tolist())
+  sent_iter = iter(
+      _finalize(tokens, stemming, stopwords) for tokens in token_lists)
+  return [[next(sent_iter) for _ in doc] for doc in docs]
+
+
+def ngram_counts(tokens, n):
+  """ Counter of n-gram tuples in tokens. """
+  return Counter(zip(*[tokens[i:] for i in range(n)]))
+
+
+def skip_bigram_counts(tokens, max_gap=4, with_unigram=True):
+  """
+  Counter of skip-bigrams with at most max_gap words between the pair.
+  Unigrams are included as well when with_unigram is True (the -u option
+  of ROUGE-1.5.5, which makes SU from S). Unlike the Perl, which skips
+  the final token's unigram, every token's unigram is counted here, so
+  SU totals run one higher than ROUGE-1.5.5's per token list scored
+  (one per summary, since counting is over the flattened summary).
+  """
+  counts = Counter()
+  for i, tok in enumerate(tokens):
+    if with_unigram:
+      counts[(tok,)] += 1
+    for j in range(i + 1, min(len(tokens), i + max_gap + 2)):
+      counts[(tok, tokens[j])] += 1
+  return counts
+
+
+def f_score(recall, precision, alpha=0.5):
+  """ F-measure with relative importance alpha (the -p option). """
+  denom = alpha * recall + (1 - alpha) * precision
+  if denom == 0.0:
+    return 0.0
+  return recall * precision / denom
+
+
+def _overlap_counts(peer_counts, ref_counts):
+  overlap = sum((peer_counts & ref_counts).values())
+  return overlap, sum(peer_counts.values()), sum(ref_counts.values())
+
+
+def _counts_to_score(hit, peer_total, ref_total, alpha):
+  recall = hit / ref_total if ref_total else 0.0
+  precision = hit / peer_total if peer_total else 0.0
+  return recall, precision, f_score(recall, precision, alpha)
+
+
+def _overlap_score(peer_counts, ref_counts, alpha):
+  return _counts_to_score(*_overlap_counts(peer_counts, ref_counts), alpha)
+
+
+def rouge_n(peer_tokens, ref_tokens, n, alpha=0.5):
+  """ (recall, precision, f) of ROUGE-N between two token lists. """
+  if _rouge_count is not None:
+    overlap, peer_total, ref_total = _rouge_count.ngram_overlap(
+        list(peer_tokens), list(ref_tokens), n)
+    recall = overlap / ref_total if ref_total else 0.0
+    precision = overlap / peer_total if peer_total else 0.0
+    return recall, precision, f_score(recall, precision, alpha)
+  return _overlap_score(
+      ngram_counts(peer_tokens, n), ngram_counts(ref_tokens, n), alpha)
+
+
+def rouge_su(peer_tokens, ref_tokens, max_gap=4, alpha=0.5):
+  """ (recall, precision, f) of ROUGE-SU between two token lists. """
+  return _overlap_score(
+      skip_bigram_counts(peer_tokens, max_gap),
+      skip_bigram_counts(ref_tokens, max_gap), alpha)
+
+
+def build_match_masks(ref_tokens):
+  """ token -> bitmask of its positions in ref_tokens, for lcs_length. """
+  masks = {}
+  for i, tok in enumerate(ref_tokens):
+    masks[tok] = masks.get(tok, 0) | (1 << i)
+  return masks
+
+
+def lcs_length(ref_tokens, peer_tokens, match_masks=None):
+  """
+  LCS length via Hyyro's bit-parallel algorithm. Each row of the LCS
+  matrix lives in one arbitrary-precision int, so the update per peer
+  token is a handful of big-int ops on all reference positions at once
+  instead of a Python-level inner loop.
+  """
+  m = len(ref_tokens)
+  if m == 0 or not peer_tokens:
+    return 0
+  if match_masks is None:
+    match_masks = build_match_masks(ref_tokens)
+  full = (1 << m) - 1
+  v = full
+  for tok in peer_tokens:
+    match = match_masks.get(tok, 0)
+    u = v & match
+    v = ((v + u) | (v & ~match)) & full
+  # Each cleared bit marks one reference position consumed by the LCS.
+  return m - bin(v).count("1")
+
+
+def _lcs_positions(ref_tokens, peer_tokens):
+  """ Set of reference positions matched in an LCS with peer_tokens. """
+  m, n = len(ref_tokens), len(peer_tokens)
+  if m == 0 or n == 0:
+    return set()
+  table = [[0] * (n + 1) for _ in range(m + 1)]
+  for i in range(m):
+    row, prev = table[i + 1], table[i]
+    for j in range(n):
+      if ref_tokens[i] == peer_tokens[j]:
+        row[j + 1] = prev[j] + 1
+      else:
+        row[j + 1] = max(row[j], prev[j + 1])
+  positions = set()
+  i, j = m, n
+  while i > 0 and j > 0:
+    if ref_tokens[i - 1] == peer_tokens[j - 1]:
+      positions.add(i - 1)
+      i -= 1
+      j -= 1
+    elif table[i - 1][j] >= table[i][j - 1]:
+      i -= 1
+    else:
+      j -= 1
+  return positions
+
+
+def _lcs_hits(peer_sents, ref_sents, ref_masks=None):
+  """
+  Union-LCS hit count between peer and reference sentence lists. As in
+  ROUGE-1.5.5's sub lcs, every hit is clipped against the peer unigram
+  budget, which is shared across all reference sentences: a peer token can
+  never be credited more often than it occurs in the peer. Without the
+  clipping a short peer matched by several reference sentences would be
+  over-credited (precision could even exceed 1).
+  """
+  if len(ref_sents) == 1 and len(peer_sents) == 1:
+    # A single LCS is itself a common subsequence of the peer, so the
+    # budget cannot be exceeded and the bit-parallel length suffices.
+    return lcs_length(ref_sents[0], peer_sents[0],
+                      ref_masks[0] if ref_masks else None)
+  peer_budget = Counter(tok for sent in peer_sents for tok in sent)
+  hits = 0
+  for ref_tokens in ref_sents:
+    union = set()
+    for peer_tokens in peer_sents:
+      union |= _lcs_positions(ref_tokens, peer_tokens)
+    for pos in union:
+      tok = ref_tokens[pos]
+      if peer_budget[tok] > 0:
+        peer_budget[tok] -= 1
+        hits += 1
+  return hits
+
+
+def rouge_l(peer_sents, ref_sents, alpha=0.5, ref_masks=None):
+  """
+  Summary-level ROUGE-L between a peer and a reference summary, each a
+  list of token lists. Follows ROUGE-1.5.5: for every reference sentence
+  the union of its LCS matches against all peer sentences is counted,
+  clipped by the peer unigram budget (see _lcs_hits). ref_masks optionally
+  supplies precomputed per-sentence match masks for the reference (see
+  build_match_masks / ReferenceBundle).
+  """
+  ref_total = sum(len(s) for s in ref_sents)
+  peer_total = sum(len(s) for s in peer_sents)
+  hits = _lcs_hits(peer_sents, ref_sents, ref_masks)
+  recall = hits / ref_total if ref_total else 0.0
+  precision = hits / peer_total if peer_total else 0.0
+  return recall, precision, f_score(recall, precision, alpha)
+
+
+class ReferenceBundle:
+  """
+  Precomputed scoring state for one summary: tokenized sentences plus the
+  n-gram and skip-bigram counters. Building one per reference (or reusing
+  a prebuilt one across many candidates, see score) means the counters are
+  computed once instead of once per comparison.
+  """
+
+  def __init__(self, sents, n_gram=4, ROUGE_SU4=True, stemming=False,
+               stopwords=None):
+    self._build([tokenize(sent, stemming, stopwords) for sent in sents],
+                n_gram, ROUGE_SU4)
+
+  @classmethod
+  def from_tokens(cls, token_sents, n_gram=4, ROUGE_SU4=True):
+    """ Bundle over already-tokenized sentences (see tokenize_batch). """
+    bundle = cls.__new__(cls)
+    bundle._build(token_sents, n_gram, ROUGE_SU4)
+    return bundle
+
+  def _build(self, token_sents, n_gram, ROUGE_SU4):
+    self.sents = token_sents
+    flat = [tok for sent in self.sents for tok in sent]
+    self.ngrams = [ngram_counts(flat, n) for n in range(1, n_gram + 1)]
+    self.skip_bigrams = skip_bigram_counts(flat) if ROUGE_SU4 else None
+    # Per-sentence LCS match masks; with these cached, scoring a candidate
+    # against this bundle touches only the candidate's tokens.
+    self.match_masks = [build_match_masks(sent) for sent in self.sents]
+
+
+def _pair_counts(peer, ref, n_gram, ROUGE_SU4, ROUGE_L):
+  """ Dict of (hit, peer_total, ref_total) per metric for one peer/ref
+  pair of ReferenceBundles. """
+  counts = {}
+  for n in range(1, n_gram + 1):
+    counts[f"ROUGE-{n}"] = _overlap_counts(peer.ngrams[n - 1],
+                                           ref.ngrams[n - 1])
+  if ROUGE_SU4:
+    counts["ROUGE-SU4"] = _overlap_counts(peer.skip_bigrams, ref.skip_bigrams)
+  if ROUGE_L:
+    peer_total = sum(len(s) for s in peer.sents)
+    ref_total = sum(len(s) for s in ref.sents)
+    counts["ROUGE-L"] = (_lcs_hits(peer.sents, ref.sents, ref.match_masks),
+                         peer_total, ref_total)
+  return counts
+
+
+def _recall(counts):
+  hit, _, ref_total = counts
+  return hit / ref_total if ref_total else 0.0
+
+
+class ReferenceSet:
+  """
+  Prebuilt scoring state for one example's reference summaries. In
+  repeated-scoring workloads (e.g. RL training loops that score many
+  candidates against fixed references) building one ReferenceSet up front
+  moves all reference-side tokenization, counting and LCS mask building
+  out of the per-candidate path; see PythonROUGE.score.
+  """
+
+  def __init__(self, refs, n_gram=4, ROUGE_SU4=True, stemming=False,
+               stopwords=None):
+    self.bundles = [
+        ReferenceBundle(ref, n_gram, ROUGE_SU4, stemming, stopwords)
+        for ref in refs
+    ]
+
+
+def score(summary,
+          reference,
+          n_gram=4,
+          ROUGE_SU4=True,
+          ROUGE_L=True,
+          alpha=0.5,
+          scoring_formula="average",
+          recall_only=False,
+          f_measure_only=False,
+          stemming=False,
+          stopwords=None):
+  """
+  Score a batch of summaries against references natively.
+
+  Parameters:
+      summary: triple list, same layout as PythonROUGE.convert_and_config.
+        Only the first system of each example is scored (multi-system
+        evaluation is not supported, see the TODO in __init__).
+      reference: triple list of reference summaries. The per-example
+        entries may also be prebuilt ReferenceBundles, which lets
+        repeated-scoring workloads pay the reference-side tokenization
+        and counting only once.
+      scoring_formula: the Perl -f option. 'average' sums hit and total
+        counts over the references of an eval before computing R/P/F
+        (scoreMode A); 'best' takes the reference with the highest recall
+        (scoreMode B).
+      stemming: Porter-stem all tokens (needs nltk; the -m option).
+      stopwords: set of stopwords to drop, e.g. from load_stopwords.
+
+  Returns a dict with the same keys as PythonROUGE.output_to_dict.
+  """
+  assert len(summary) == len(
+      reference), "Size of summary and refernece is different."
+  assert not (
+      recall_only and f_measure_only
+  ), "At least one of recall_only and f_measure_only must be False."
+  if scoring_formula not in ("average", "best"):
+    raise ValueError("Choose scoring formula between 'average' and 'best'.")
+  if stemming:
+    _require_stemmer()
+
+  # For very large batches, run the tokenization through tokenize_batch
+  # (vectorized via pandas when installed) before building the bundles.
+  peer_tokens = iter(
+      tokenize_batch([sums[0] for sums in summary], stemming, stopwords))
+  ref_tokens = iter(
+      tokenize_batch([
+          ref for refs in reference for ref in refs
+          if not isinstance(ref, ReferenceBundle)
+      ], stemming, stopwords))
+
+  totals = {}
+  for sums, refs in zip(summary, reference):
+    peer = ReferenceBundle.from_tokens(next(peer_tokens), n_gram, ROUGE_SU4)
+    bundles = [
+        ref if isinstance(ref, ReferenceBundle) else ReferenceBundle.
+        from_tokens(next(ref_tokens), n_gram, ROUGE_SU4) for ref in refs
+    ]
+    per_ref = [
+        _pair_counts(peer, bundle, n_gram, ROUGE_SU4, ROUGE_L)
+        for bundle in bundles
+    ]
+    for metric in per_ref[0]:
+      counts = [ref_counts[metric] for ref_counts in per_ref]
+      if scoring_formula == "best":
+        # scoreMode B selects the best model by recall, not by F.
+        chosen = max(counts, key=_recall)
+      else:
+        # scoreMode A aggregates hits and totals over the models of this
+        # eval and computes R/P/F from the sums.
+        chosen = tuple(sum(vals) for vals in zip(*counts))
+      triple = _counts_to_score(*chosen, alpha)
+      acc = totals.setdefault(metric, [0.0, 0.0, 0.0])
+      for k in range(3):
+        acc[k] += triple[k]
+
+  n_eval = len(summary)
+  result = dict()
+  for metric, (r_sum, p_sum, f_sum) in totals.items():
+    r, p, f = r_sum / n_eval, p_sum / n_eval, f_sum / n_eval
+    if recall_only:
+      result[metric] = round(r, 5)
+    elif f_measure_only:
+      result[metric] = round(f, 5)
+    else:
+      result[metric + "-R"] = round(r, 5)
+      result[metric + "-P"] = round(p, 5)
+      result[metric + "-F"] = round(f, 5)
+  return result
+
+
+def score_batch(summary, reference, cfg, recall_only=False,
+                f_measure_only=False):
+  """
+  Score a batch with the settings of a PythonROUGE instance, going straight
+  from sentence lists to scores with no file I/O or subprocess.
+  """
+  stopwords = load_stopwords(cfg.data_path) if cfg.stopwords else None
+  return score(
+      summary,
+      reference,
+      n_gram=cfg.n_gram,
+      ROUGE_SU4=cfg.ROUGE_SU4,
+      ROUGE_L=cfg.ROUGE_L,
+      alpha=cfg.p if cfg.favor else 0.5,
+      scoring_formula=cfg.scoring_formula,
+      recall_only=recall_only,
+      f_measure_only=f_measure_only,
+      stemming=cfg.stemming,
+      stopwords=stopwords)
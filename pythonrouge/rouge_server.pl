@@ -0,0 +1,43 @@
+#!/usr/bin/perl
+# Persistent ROUGE harness.
+#
+# Keeps one Perl interpreter alive and runs ROUGE-1.5.5.pl once per config
+# path read from stdin, so interpreter startup and loading of XML::DOM,
+# DB_File and the WordNet exception DB are paid once per process instead
+# of once per evaluation.
+#
+# Usage:    perl rouge_server.pl /path/to/ROUGE-1.5.5.pl [ROUGE options...]
+# Protocol: one config-file path per stdin line; the ROUGE report for it is
+#           written to stdout, terminated by a "<<<ROUGE-DONE>>>" line.
+#           An empty line (or EOF) shuts the server down.
+use strict;
+use warnings;
+
+# ROUGE-1.5.5.pl does not call exit on a normal run, but make sure a stray
+# exit (e.g. from its usage message) cannot take the whole server down.
+BEGIN { *CORE::GLOBAL::exit = sub { die "ROUGE_EXIT\n" }; }
+
+my $script = shift @ARGV
+    or die "usage: rouge_server.pl ROUGE-1.5.5.pl [options...]\n";
+die "rouge_server.pl: cannot read $script\n" unless -r $script;
+my @base_args = @ARGV;
+$| = 1;
+
+while ( my $line = <STDIN> ) {
+    chomp $line;
+    last if $line eq "";
+    {
+        local @ARGV = ( @base_args, $line );
+        # do FILE traps die (and the overridden exit) itself, setting $@
+        # like eval STRING does, so check $@ afterwards instead of
+        # wrapping it in another eval.
+        $@ = "";
+        do $script;
+        if ($@) {
+            my $err = $@ eq "ROUGE_EXIT\n" ? "script called exit" : $@;
+            $err =~ s/\s+/ /g;
+            print "ROUGE-SERVER-ERROR: $err\n";
+        }
+    }
+    print "<<<ROUGE-DONE>>>\n";
+}
@@ -1,5 +1,13 @@
 from setuptools import setup, find_packages
 
+# The compiled n-gram counter is optional: build it when Cython is
+# available, fall back to the pure-Python Counter path otherwise.
+try:
+  from Cython.Build import cythonize
+  ext_modules = cythonize(["pythonrouge/_rouge_count.pyx"])
+except ImportError:
+  ext_modules = []
+
 setup(
     name="pythonrouge",
     version="0.4",
@@ -12,6 +20,7 @@ setup(
         "summarization"
     ],
     packages=["pythonrouge"],
+    ext_modules=ext_modules,
     classifiers=[
         "Intended Audience :: Science/Research",
         "License :: OSI Approved :: MIT License",